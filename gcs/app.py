@@ -4,6 +4,7 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QFrame, QMessageBox, QShortcut, QInputDialog)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QKeySequence
+import logging
 import time
 
 from .styles import DARK_STYLE
@@ -15,6 +16,8 @@ from .models.target import TargetQueue, TargetSource
 from .models.orb import OrbManager, OrbState
 from .comms import MAVLinkManager, LoRaManager, VideoManager
 
+logger = logging.getLogger(__name__)
+
 
 class GCSMainWindow(QMainWindow):
     """Main GCS window."""
@@ -94,7 +97,9 @@ class GCSMainWindow(QMainWindow):
     def _connect_comms_signals(self):
         """Connect communication manager signals."""
         # MAVLink telemetry
-        self._mavlink.telemetry_received.connect(self._on_telemetry_received)
+        # Emitted from the MAVLink receiver thread; always queue onto the GUI
+        # thread, where VehiclePanel batches the updates per frame
+        self._mavlink.telemetry_received.connect(self._on_telemetry_received, Qt.QueuedConnection)
         self._mavlink.connection_changed.connect(self._on_mavlink_connection_changed)
         self._mavlink.mode_changed.connect(self._on_mode_changed)
 
@@ -178,6 +183,8 @@ class GCSMainWindow(QMainWindow):
         self.target_queue.target_removed.connect(self._on_target_removed)
         self.target_queue.target_renamed.connect(self._on_target_renamed)
         self.target_queue.target_description_changed.connect(self._on_target_description_changed)
+        self.target_queue.targets_imported.connect(self._on_targets_imported)
+        self.target_queue.parse_error.connect(lambda msg: logger.warning("Coord parse error: %s", msg))
         bottom_left_layout.addWidget(self.target_queue)
 
         # Mission panel (shown in MISSION tab)
@@ -688,6 +695,7 @@ class GCSMainWindow(QMainWindow):
     def _on_manual_entry(self):
         """Show manual coordinate entry dialog."""
         dialog = ManualCoordDialog(self)
+        dialog.parse_error.connect(lambda msg: logger.warning("Coord parse error: %s", msg))
         if dialog.exec_():
             lat, lon, name, description = dialog.get_coordinates()
             if lat is not None and lon is not None:
@@ -700,6 +708,16 @@ class GCSMainWindow(QMainWindow):
                 self._update_map()
                 print(f"[Target] Manual entry: {target}")
 
+    def _on_targets_imported(self, coords: list):
+        """Add targets parsed from an imported coordinate file."""
+        for lat, lon, name in coords:
+            target = self._targets.add(lat, lon, TargetSource.IMPORT)
+            if name:
+                self._targets.rename(target.id, name)
+        self._update_target_queue()
+        self._update_map()
+        print(f"[Target] Imported {len(coords)} targets")
+
     def _on_orb_selected(self, orb_id: str):
         """Handle orb selection."""
         self._orbs.selected = orb_id
@@ -126,14 +126,78 @@ QFrame#vehicle_card {
     background-color: #2a2a4a;
     border: 2px solid #3a3a5a;
     border-radius: 6px;
-    padding: 8px;
 }
 
-QFrame#vehicle_card_selected {
+QFrame#vehicle_card[selected="true"] {
     background-color: #2a3a5a;
     border: 2px solid #4a8aba;
-    border-radius: 6px;
-    padding: 8px;
+}
+
+QLabel#vehicle_alt {
+    color: #a0a0a0;
+}
+
+QFrame#hud_separator {
+    background-color: #3a3a5a;
+}
+
+QLabel#video_display {
+    background-color: #0a0a1a;
+    border: 1px solid #3a3a5a;
+}
+
+QLabel[role="hud_key"] {
+    color: #808080;
+    font-size: 9px;
+}
+
+QLabel[role="hud_val"] {
+    font-size: 10px;
+}
+
+/* Telemetry label colours, switched via the "severity" dynamic property */
+QLabel[severity="normal"] {
+    color: #e0e0e0;
+}
+
+QLabel[severity="ok"] {
+    color: #4ade80;
+}
+
+QLabel[severity="warn"] {
+    color: #facc15;
+}
+
+QLabel[severity="alert"] {
+    color: #f97316;
+}
+
+QLabel[severity="crit"] {
+    color: #f87171;
+}
+
+QLabel[severity="info"] {
+    color: #60a5fa;
+}
+
+QLabel[severity="off"] {
+    color: #808080;
+}
+
+QLabel[severity="na"] {
+    color: #606080;
+}
+
+QLabel[severity="muted"] {
+    color: #a0a0a0;
+}
+
+QLabel[severity="idle"] {
+    color: #404060;
+}
+
+QLabel#status_sep {
+    color: #3a3a5a;
 }
 
 QTableWidget {
@@ -241,3 +305,15 @@ QLineEdit:focus {
     border-color: #6a8aba;
 }
 """
+
+
+def set_style_property(widget, name: str, value):
+    """
+    Set a dynamic property used by DARK_STYLE selectors and re-polish the
+    widget so the new rules apply. No-op if the value is unchanged.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
@@ -1,41 +1,76 @@
 # Link Status Bar for SwarmDrones GCS
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QFrame
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QFrame, QSizePolicy
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QFont, QColor, QPainter
 
+from ..styles import set_style_property
 
-class StatusIndicator(QWidget):
-    """Individual status indicator with label and icon."""
 
-    def __init__(self, label: str, parent=None):
-        super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(4)
+class CompactIndicator(QWidget):
+    """Link indicator drawn directly with QPainter ("LABEL ● rssi").
 
-        self.label = QLabel(label)
-        self.label.setStyleSheet("color: #a0a0a0;")
-        layout.addWidget(self.label)
+    Avoids a layout of stylesheeted QLabels; state changes just store the
+    new values and schedule a repaint with update().
+    """
 
-        self.indicator = QLabel("○")
-        self.indicator.setStyleSheet("color: #404060;")
-        layout.addWidget(self.indicator)
+    _LABEL_DIM = QColor("#a0a0a0")
+    _LABEL_BRIGHT = QColor("#e0e0e0")
+    _DOT_IDLE = QColor("#404060")
+    _DOT_ON = QColor("#4ade80")
+    _DOT_OFF = QColor("#f87171")
+
+    def __init__(self, label: str, parent=None):
+        super().__init__(parent)
+        self._label = label
+        self._rssi = None
+        self._dot = "○"
+        self._color = self._DOT_IDLE
+        self._label_color = self._LABEL_DIM
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+
+    def _text_parts(self):
+        label = self._label if self._rssi is None else f"{self._label} {self._rssi}"
+        return label, self._dot
+
+    def sizeHint(self) -> QSize:
+        label, dot = self._text_parts()
+        fm = self.fontMetrics()
+        width = fm.horizontalAdvance(f"{label} {dot}") + 4
+        return QSize(width, fm.height())
+
+    def paintEvent(self, event):
+        label, dot = self._text_parts()
+        p = QPainter(self)
+        rect = self.rect()
+        p.setPen(self._label_color)
+        p.drawText(rect, Qt.AlignVCenter | Qt.AlignLeft, label)
+        x = self.fontMetrics().horizontalAdvance(label + " ")
+        p.setPen(self._color)
+        p.drawText(rect.adjusted(x, 0, 0, 0), Qt.AlignVCenter | Qt.AlignLeft, dot)
 
     def set_status(self, connected: bool, rssi: int = None):
         """Update status. rssi is optional signal strength."""
+        color = self._DOT_ON if connected else self._DOT_OFF
         if connected:
-            self.indicator.setText("●")
-            self.indicator.setStyleSheet("color: #4ade80;")
-            if rssi is not None:
-                self.label.setStyleSheet("color: #e0e0e0;")
+            label_color = self._LABEL_BRIGHT if rssi is not None else self._label_color
         else:
-            self.indicator.setText("●")
-            self.indicator.setStyleSheet("color: #f87171;")
-            self.label.setStyleSheet("color: #a0a0a0;")
+            label_color = self._LABEL_DIM
+        if rssi is not None and rssi != self._rssi:
+            self._rssi = rssi
+            self.updateGeometry()
+        elif self._dot == "●" and color == self._color and label_color == self._label_color:
+            return
+        self._dot = "●"
+        self._color = color
+        self._label_color = label_color
+        self.update()
 
     def set_rssi(self, rssi: int):
         """Update with RSSI value."""
-        self.label.setText(f"{self.label.text().split()[0]} {rssi}")
+        if rssi != self._rssi:
+            self._rssi = rssi
+            self.updateGeometry()
+            self.update()
 
 
 class MeshIndicator(QWidget):
@@ -48,7 +83,7 @@ class MeshIndicator(QWidget):
         layout.setSpacing(8)
 
         self.mesh_label = QLabel("MESH:")
-        self.mesh_label.setStyleSheet("color: #a0a0a0;")
+        self.mesh_label.setProperty("severity", "muted")
         layout.addWidget(self.mesh_label)
 
         # Individual node indicators
@@ -58,15 +93,15 @@ class MeshIndicator(QWidget):
             node_layout.setSpacing(2)
 
             label = QLabel(name)
-            label.setStyleSheet("color: #808080;")
+            label.setProperty("severity", "off")
             node_layout.addWidget(label)
 
             rssi = QLabel("--")
-            rssi.setStyleSheet("color: #808080;")
+            rssi.setProperty("severity", "off")
             node_layout.addWidget(rssi)
 
             indicator = QLabel("○")
-            indicator.setStyleSheet("color: #404060;")
+            indicator.setProperty("severity", "idle")
             node_layout.addWidget(indicator)
 
             self.nodes[name] = {"label": label, "rssi": rssi, "indicator": indicator}
@@ -80,17 +115,17 @@ class MeshIndicator(QWidget):
         node = self.nodes[name]
         if connected:
             node["indicator"].setText("●")
-            node["indicator"].setStyleSheet("color: #4ade80;")
-            node["label"].setStyleSheet("color: #e0e0e0;")
+            set_style_property(node["indicator"], "severity", "ok")
+            set_style_property(node["label"], "severity", "normal")
             if rssi is not None:
                 node["rssi"].setText(str(rssi))
-                node["rssi"].setStyleSheet("color: #a0a0a0;")
+                set_style_property(node["rssi"], "severity", "muted")
         else:
             node["indicator"].setText("●")
-            node["indicator"].setStyleSheet("color: #f87171;")
-            node["label"].setStyleSheet("color: #808080;")
+            set_style_property(node["indicator"], "severity", "crit")
+            set_style_property(node["label"], "severity", "off")
             node["rssi"].setText("--")
-            node["rssi"].setStyleSheet("color: #808080;")
+            set_style_property(node["rssi"], "severity", "off")
 
 
 class StatusBar(QFrame):
@@ -113,26 +148,26 @@ class StatusBar(QFrame):
 
         # Separator
         sep1 = QLabel("|")
-        sep1.setStyleSheet("color: #3a3a5a;")
+        sep1.setObjectName("status_sep")
         layout.addWidget(sep1)
 
         # MLRS status
-        self.mlrs = StatusIndicator("MLRS:")
+        self.mlrs = CompactIndicator("MLRS:")
         layout.addWidget(self.mlrs)
 
         # 4G status
-        self.lte = StatusIndicator("4G:")
+        self.lte = CompactIndicator("4G:")
         layout.addWidget(self.lte)
 
         # ELRS status
-        self.elrs = StatusIndicator("ELRS:")
+        self.elrs = CompactIndicator("ELRS:")
         layout.addWidget(self.elrs)
 
         layout.addStretch()
 
         # Time
         self.time_label = QLabel("--:--:--")
-        self.time_label.setStyleSheet("color: #808080;")
+        self.time_label.setProperty("severity", "off")
         layout.addWidget(self.time_label)
 
     def update_mesh(self, bird: tuple = None, c1: tuple = None, c2: tuple = None):
@@ -4,9 +4,21 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                               QFrame, QTableWidget, QTableWidgetItem,
                               QPushButton, QHeaderView, QAbstractItemView,
                               QDialog, QLineEdit, QFormLayout, QDialogButtonBox,
-                              QComboBox, QTextEdit, QSplitter, QGroupBox)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont
+                              QComboBox, QTextEdit, QSplitter, QGroupBox,
+                              QFileDialog, QMessageBox, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread
+from PyQt5.QtGui import QFont, QValidator
+
+# Lazily created mgrs.MGRS() converter, shared by all parse_mgrs calls
+_MGRS_INSTANCE = None
+
+# Trailing hemisphere letter -> whether the value is negative
+_HEMI = {'S': True, 'W': True, 'N': False, 'E': False}
+
+_DDM_RE = re.compile(r'^(\d+)[°\s]+(\d+\.?\d*)[\'′]?$')
+_DMS_RE = re.compile(r'^(\d+)[°\s]+(\d+)[\'′\s]+(\d+\.?\d*)[\"″]?$')
+# Characters that can appear in a partially typed coordinate
+_COORD_RE = re.compile(r'^[\s\d.°\'′\"″+-]*[NSEWnsew]?$')
 
 
 def parse_coordinate(coord_str: str, coord_type: str = "lat") -> float:
@@ -25,15 +37,14 @@ def parse_coordinate(coord_str: str, coord_type: str = "lat") -> float:
     coord_str = coord_str.strip().upper()
 
     # Check for hemisphere indicator
-    negative = False
-    if coord_str.endswith(('S', 'W')):
-        negative = True
-        coord_str = coord_str[:-1].strip()
-    elif coord_str.endswith(('N', 'E')):
-        coord_str = coord_str[:-1].strip()
+    negative = _HEMI.get(coord_str[-1:])
+    if negative is not None:
+        coord_str = coord_str[:-1].rstrip()
     elif coord_str.startswith('-'):
         negative = True
         coord_str = coord_str[1:].strip()
+    else:
+        negative = False
 
     # Try DDD.DDDD format (decimal degrees)
     try:
@@ -43,7 +54,7 @@ def parse_coordinate(coord_str: str, coord_type: str = "lat") -> float:
         pass
 
     # Try DD MM.MMMM format (degrees decimal minutes)
-    ddm_match = re.match(r'^(\d+)[°\s]+(\d+\.?\d*)[\'′]?$', coord_str)
+    ddm_match = _DDM_RE.match(coord_str)
     if ddm_match:
         degrees = float(ddm_match.group(1))
         minutes = float(ddm_match.group(2))
@@ -51,7 +62,7 @@ def parse_coordinate(coord_str: str, coord_type: str = "lat") -> float:
         return -value if negative else value
 
     # Try DD MM SS.SS format (degrees minutes seconds)
-    dms_match = re.match(r'^(\d+)[°\s]+(\d+)[\'′\s]+(\d+\.?\d*)[\"″]?$', coord_str)
+    dms_match = _DMS_RE.match(coord_str)
     if dms_match:
         degrees = float(dms_match.group(1))
         minutes = float(dms_match.group(2))
@@ -72,13 +83,17 @@ def parse_mgrs(mgrs_str: str) -> tuple:
     """
     # Basic MGRS parsing - for full support would need mgrs library
     # pip install mgrs
+    global _MGRS_INSTANCE
+    if _MGRS_INSTANCE is None:
+        try:
+            import mgrs
+        except ImportError:
+            raise ValueError("MGRS library not installed. Run: pip install mgrs")
+        _MGRS_INSTANCE = mgrs.MGRS()
+
     try:
-        import mgrs
-        m = mgrs.MGRS()
-        lat, lon = m.toLatLon(mgrs_str.replace(' ', ''))
+        lat, lon = _MGRS_INSTANCE.toLatLon(mgrs_str.replace(' ', ''))
         return lat, lon
-    except ImportError:
-        raise ValueError("MGRS library not installed. Run: pip install mgrs")
     except Exception as e:
         raise ValueError(f"Invalid MGRS: {e}")
 
@@ -96,9 +111,70 @@ def format_ddm(lat: float, lon: float) -> str:
     return f"{lat_deg:02d} {lat_min:06.3f}{lat_dir}  {lon_deg:03d} {lon_min:06.3f}{lon_dir}"
 
 
+def _set_text_if_changed(widget, text: str):
+    """Call setText only when the text differs, avoiding a needless repaint."""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def parse_coordinate_line(line: str) -> tuple:
+    """
+    Parse one line of a coordinate import file.
+    Accepts "lat, lon[, name]" in any parse_coordinate format, or
+    "MGRS[, name]".
+
+    Returns:
+        (lat, lon, name)
+    """
+    parts = [p.strip() for p in line.split(',')]
+    try:
+        lat = parse_coordinate(parts[0], "lat")
+        lon = parse_coordinate(parts[1], "lon")
+        name = parts[2] if len(parts) > 2 else ""
+    except (ValueError, IndexError):
+        lat, lon = parse_mgrs(parts[0])
+        name = parts[1] if len(parts) > 1 else ""
+    return lat, lon, name
+
+
+class CoordParserWorker(QObject):
+    """Parses imported coordinate lines off the GUI thread."""
+
+    parsed = pyqtSignal(list, int)  # [(lat, lon, name)], skipped line count
+
+    def parse(self, lines: list):
+        """Parse lines, skipping blanks, '#' comments and malformed entries."""
+        results = []
+        skipped = 0
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                results.append(parse_coordinate_line(line))
+            except ValueError:
+                skipped += 1
+        self.parsed.emit(results, skipped)
+
+
+class LatLonValidator(QValidator):
+    """Validates coordinate text as it is typed using parse_coordinate formats."""
+
+    def validate(self, text, pos):
+        if not _COORD_RE.match(text):
+            return QValidator.Invalid, text, pos
+        try:
+            parse_coordinate(text)
+        except ValueError:
+            return QValidator.Intermediate, text, pos
+        return QValidator.Acceptable, text, pos
+
+
 class ManualCoordDialog(QDialog):
     """Dialog for manual coordinate entry with multiple format support."""
 
+    parse_error = pyqtSignal(str)  # error message
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Manual Coordinate Entry")
@@ -137,10 +213,13 @@ class ManualCoordDialog(QDialog):
         self.dd_widget = QWidget()
         dd_layout = QFormLayout(self.dd_widget)
         dd_layout.setContentsMargins(0, 0, 0, 0)
+        coord_validator = LatLonValidator(self)
         self.lat_dd = QLineEdit()
+        self.lat_dd.setValidator(coord_validator)
         self.lat_dd.setPlaceholderText("52.1234 or 52.1234N")
         dd_layout.addRow("Latitude:", self.lat_dd)
         self.lon_dd = QLineEdit()
+        self.lon_dd.setValidator(coord_validator)
         self.lon_dd.setPlaceholderText("-1.5678 or 1.5678W")
         dd_layout.addRow("Longitude:", self.lon_dd)
         stack_layout.addWidget(self.dd_widget)
@@ -150,9 +229,11 @@ class ManualCoordDialog(QDialog):
         ddm_layout = QFormLayout(self.ddm_widget)
         ddm_layout.setContentsMargins(0, 0, 0, 0)
         self.lat_ddm = QLineEdit()
+        self.lat_ddm.setValidator(coord_validator)
         self.lat_ddm.setPlaceholderText("52 07.404N")
         ddm_layout.addRow("Latitude:", self.lat_ddm)
         self.lon_ddm = QLineEdit()
+        self.lon_ddm.setValidator(coord_validator)
         self.lon_ddm.setPlaceholderText("001 34.068W")
         ddm_layout.addRow("Longitude:", self.lon_ddm)
         stack_layout.addWidget(self.ddm_widget)
@@ -219,8 +300,8 @@ class ManualCoordDialog(QDialog):
 
             return lat, lon, name, desc
 
-        except (ValueError, Exception) as e:
-            print(f"[Coord Parse Error] {e}")
+        except ValueError as e:
+            self.parse_error.emit(str(e))
             return None, None, "", ""
 
 
@@ -234,6 +315,7 @@ class TargetDetailPanel(QFrame):
         super().__init__(parent)
         self.setObjectName("panel")
         self._current_target_id = None
+        self._last_payload = None  # Last update_target() arguments
         self._setup_ui()
 
     def _setup_ui(self):
@@ -298,19 +380,25 @@ class TargetDetailPanel(QFrame):
     def update_target(self, target_id: str, lat: float, lon: float,
                       source: str, orb_id: str, name: str, description: str):
         """Update panel with target details."""
+        payload = (target_id, lat, lon, source, orb_id, name, description)
+        if payload == self._last_payload:
+            return
+        self._last_payload = payload
         self._current_target_id = target_id
 
-        self.coord_label.setText(f"{lat:.5f}, {lon:.5f}")
-        self.ddm_label.setText(format_ddm(lat, lon))
-        self.source_label.setText(source)
-        self.orb_label.setText(f"ORB{orb_id}" if orb_id else "--")
+        _set_text_if_changed(self.coord_label, f"{lat:.5f}, {lon:.5f}")
+        _set_text_if_changed(self.ddm_label, format_ddm(lat, lon))
+        _set_text_if_changed(self.source_label, source)
+        _set_text_if_changed(self.orb_label, f"ORB{orb_id}" if orb_id else "--")
 
-        self.name_edit.setText(name)
-        self.desc_edit.setText(description)
+        _set_text_if_changed(self.name_edit, name)
+        if self.desc_edit.toPlainText() != description:
+            self.desc_edit.setText(description)
 
     def clear(self):
         """Clear the panel."""
         self._current_target_id = None
+        self._last_payload = None
         self.coord_label.setText("--")
         self.ddm_label.setText("--")
         self.source_label.setText("--")
@@ -337,12 +425,18 @@ class TargetQueueWidget(QFrame):
     target_removed = pyqtSignal(str)  # target_id
     target_renamed = pyqtSignal(str, str)  # target_id, new_name
     target_description_changed = pyqtSignal(str, str)  # target_id, new_description
+    targets_imported = pyqtSignal(list)  # [(lat, lon, name)]
+    parse_error = pyqtSignal(str)  # import problem, e.g. skipped lines
+    parse_requested = pyqtSignal(list)  # raw coordinate lines, to parser thread
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("panel")
         self._selected_id = None
         self._targets_data = []  # Store full target data
+        self._index_by_id = {}  # target_id -> table row
+        self._parser_thread = None  # Created on first import
+        self._parser = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -403,6 +497,16 @@ class TargetQueueWidget(QFrame):
         manual_btn.clicked.connect(self.manual_entry_requested.emit)
         btn_layout.addWidget(manual_btn)
 
+        import_btn = QPushButton("Import")
+        import_btn.setToolTip(
+            "Import a UTF-8 text/CSV file, one target per line:\n"
+            "  lat, lon[, name]  (decimal, DDM or DMS)\n"
+            "  MGRS[, name]\n"
+            "Blank lines and lines starting with # are ignored"
+        )
+        import_btn.clicked.connect(self._on_import_clicked)
+        btn_layout.addWidget(import_btn)
+
         btn_layout.addStretch()
 
         remove_btn = QPushButton("Remove")
@@ -446,12 +550,72 @@ class TargetQueueWidget(QFrame):
         if self._selected_id:
             self.target_removed.emit(self._selected_id)
 
+    def _on_import_clicked(self):
+        """
+        Load a coordinate list file and hand it to the parser thread.
+
+        The file is read as UTF-8 (BOM allowed) so degree/minute/second
+        symbols survive on Windows. One target per line: "lat, lon[, name]"
+        in decimal, DDM or DMS, or "MGRS[, name]"; blank and '#' lines are
+        ignored.
+        """
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Import Targets", "", "Coordinate Files (*.txt *.csv);;All Files (*)"
+        )
+        if filename:
+            try:
+                with open(filename, 'r', encoding='utf-8-sig') as f:
+                    lines = f.read().splitlines()
+            except (OSError, UnicodeDecodeError) as e:
+                QMessageBox.critical(self, "Import Error", str(e))
+                return
+            self.import_coordinates(lines)
+
+    def import_coordinates(self, lines: list):
+        """
+        Parse coordinate lines on a worker thread.
+        Results arrive asynchronously via targets_imported.
+        """
+        if self._parser_thread is None:
+            self._parser_thread = QThread()
+            self._parser = CoordParserWorker()
+            self._parser.moveToThread(self._parser_thread)
+            self.parse_requested.connect(self._parser.parse)
+            self._parser.parsed.connect(self._on_coords_parsed)
+            # No QApplication when embedded in tests/tools; nothing to hook then
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._stop_parser)
+            self._parser_thread.start()
+        self.parse_requested.emit(lines)
+
+    def _on_coords_parsed(self, results: list, skipped: int):
+        """Handle parsed import results (runs on the GUI thread)."""
+        if skipped:
+            message = f"Import skipped {skipped} unparseable line(s)"
+            self.parse_error.emit(message)
+            QMessageBox.warning(self, "Import Targets",
+                                f"{message}; imported {len(results)} target(s).")
+        if results:
+            self.targets_imported.emit(results)
+
+    def _stop_parser(self):
+        """Stop the parser thread on application exit."""
+        if self._parser_thread is not None:
+            self._parser_thread.quit()
+            self._parser_thread.wait()
+
     def update_targets(self, targets: list):
         """
         Update the target list.
         targets: [(id, lat, lon, source, orb_id, name, description)]
+
+        Display strings are cached on each target entry and only rebuilt
+        when the underlying value changed since the previous refresh.
         """
+        previous = {data['id']: data for data in self._targets_data}
         self._targets_data = []
+        self._index_by_id = {}
         self.table.setRowCount(len(targets))
 
         for i, target_data in enumerate(targets):
@@ -462,7 +626,7 @@ class TargetQueueWidget(QFrame):
             else:
                 tid, lat, lon, source, orb_id, name, description = target_data
 
-            self._targets_data.append({
+            data = {
                 'id': tid,
                 'lat': lat,
                 'lon': lon,
@@ -470,45 +634,57 @@ class TargetQueueWidget(QFrame):
                 'orb_id': orb_id,
                 'name': name,
                 'description': description
-            })
+            }
+            prior = previous.get(tid)
 
-            # Name/ID column
-            display_name = name if name else f"TGT{tid}"
-            id_item = QTableWidgetItem(f"◎{display_name}")
-            id_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(i, 0, id_item)
+            if prior and prior['name'] == name:
+                data['display_name'] = prior['display_name']
+            else:
+                data['display_name'] = f"◎{name if name else f'TGT{tid}'}"
+
+            if prior and prior['lat'] == lat and prior['lon'] == lon:
+                data['coord_str'] = prior['coord_str']
+            else:
+                data['coord_str'] = f"{lat:.4f}, {lon:.4f}"
 
-            # Coordinates
-            coord_item = QTableWidgetItem(f"{lat:.4f}, {lon:.4f}")
-            self.table.setItem(i, 1, coord_item)
+            if prior and prior['orb_id'] == orb_id:
+                data['orb_str'] = prior['orb_str']
+            else:
+                data['orb_str'] = f"ORB{orb_id}" if orb_id else "--"
 
-            # Source
-            source_item = QTableWidgetItem(source)
-            source_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(i, 2, source_item)
+            self._targets_data.append(data)
+            self._index_by_id[tid] = i
 
-            # Orb assignment
-            orb_text = f"ORB{orb_id}" if orb_id else "--"
-            orb_item = QTableWidgetItem(orb_text)
-            orb_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(i, 3, orb_item)
+            # Name/ID, coordinates, source, orb assignment
+            self._set_cell(i, 0, data['display_name'], Qt.AlignCenter)
+            self._set_cell(i, 1, data['coord_str'])
+            self._set_cell(i, 2, source, Qt.AlignCenter)
+            self._set_cell(i, 3, data['orb_str'], Qt.AlignCenter)
 
         # Restore selection and update details
-        if self._selected_id:
-            for i, data in enumerate(self._targets_data):
-                if data['id'] == self._selected_id:
-                    self.table.selectRow(i)
-                    self.detail_panel.update_target(
-                        data['id'], data['lat'], data['lon'],
-                        data['source'], data['orb_id'],
-                        data['name'], data['description']
-                    )
-                    break
-            else:
-                self.detail_panel.clear()
+        row = self._index_by_id.get(self._selected_id) if self._selected_id else None
+        if row is not None:
+            data = self._targets_data[row]
+            self.table.selectRow(row)
+            self.detail_panel.update_target(
+                data['id'], data['lat'], data['lon'],
+                data['source'], data['orb_id'],
+                data['name'], data['description']
+            )
         else:
             self.detail_panel.clear()
 
+    def _set_cell(self, row: int, col: int, text: str, alignment=None):
+        """Reuse the existing table item, touching it only if its text changed."""
+        item = self.table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(text)
+            if alignment is not None:
+                item.setTextAlignment(alignment)
+            self.table.setItem(row, col, item)
+        elif item.text() != text:
+            item.setText(text)
+
     def select_next(self):
         """Select next target in queue."""
         row_count = self.table.rowCount()
@@ -521,14 +697,10 @@ class TargetQueueWidget(QFrame):
 
     def select_target(self, target_id: str):
         """Select a specific target by ID."""
-        for row in range(self.table.rowCount()):
-            id_item = self.table.item(row, 0)
-            if id_item:
-                # ID stored in column 0, format is "◎{id}"
-                item_id = id_item.text().replace("◎", "")
-                if item_id == target_id:
-                    self.table.selectRow(row)
-                    return True
+        row = self._index_by_id.get(target_id)
+        if row is not None:
+            self.table.selectRow(row)
+            return True
         return False
 
     @property
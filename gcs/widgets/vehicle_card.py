@@ -1,8 +1,105 @@
 # Vehicle Status Card Widget for SwarmDrones GCS
+#
+# Threading: everything here runs on the GUI thread. Card clicks are wired
+# with Qt.DirectConnection. Telemetry from the MAVLink receiver thread must
+# reach VehiclePanel.update_vehicle through a Qt.QueuedConnection; the panel
+# then coalesces updates and repaints at most once per frame.
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QFrame, QProgressBar, QGridLayout, QSizePolicy)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont
+                              QFrame, QGridLayout, QSizePolicy, QFormLayout)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtGui import QFont, QColor, QPainter
+from typing import Optional, Tuple
+
+from ..styles import set_style_property
+
+# Label severities, looked up once per telemetry update. Colours for each
+# severity live in the app-wide stylesheet (QLabel[severity="..."]).
+_MODE_SEVERITY = {
+    "RTL": "warn",
+    "LAND": "warn",
+    "AUTO": "ok",
+    "GUIDED": "ok",
+}
+_DEFAULT_MODE_SEVERITY = "info"
+
+# Chick attachment state -> (display text, severity)
+_CHICK_STATE_STYLE = {
+    "attached": ("ATTACHED", "warn"),       # Yellow
+    "launching": ("LAUNCHING", "alert"),    # Orange
+    "launched": ("LAUNCHED", "ok"),         # Green
+    "recovered": ("RECOVERED", "info"),     # Blue
+}
+
+# (vehicle_id, name, icon) for every configured vehicle, built on first use.
+# config is imported lazily so importing the widgets package doesn't load it.
+_VEHICLE_ENTRIES: Optional[Tuple[Tuple[str, str, str], ...]] = None
+
+
+def _get_vehicle_entries() -> Tuple[Tuple[str, str, str], ...]:
+    global _VEHICLE_ENTRIES
+    if _VEHICLE_ENTRIES is None:
+        from ..config import get_all_vehicles
+        _VEHICLE_ENTRIES = tuple((vid, info.get("name", vid), info.get("icon", "?"))
+                                 for vid, info in get_all_vehicles().items())
+    return _VEHICLE_ENTRIES
+
+
+def _mode_severity(mode: str) -> str:
+    return _MODE_SEVERITY.get(mode, _DEFAULT_MODE_SEVERITY)
+
+
+def _batt_severity(pct: int) -> str:
+    if pct > 50:
+        return "ok"
+    elif pct > 20:
+        return "warn"
+    return "crit"
+
+
+class BatteryBar(QWidget):
+    """Battery level bar painted directly, without QStyle/stylesheet work."""
+
+    _BACKGROUND = QColor("#2a2a4a")
+    _BORDER = QColor("#3a3a5a")
+    _TEXT = QColor("#e0e0e0")
+    _BAND_COLORS = {
+        "good": QColor("#4ade80"),
+        "warn": QColor("#facc15"),
+        "crit": QColor("#f87171"),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._value = 0
+        self._band_color = self._BAND_COLORS["good"]
+
+    def value(self) -> int:
+        return self._value
+
+    def setValue(self, value: int):
+        value = max(0, min(100, value))
+        if value != self._value:
+            self._value = value
+            self.update()
+
+    def setBand(self, band: str):
+        """Set colour band: "good", "warn" or "crit"."""
+        color = self._BAND_COLORS[band]
+        if color is not self._band_color:
+            self._band_color = color
+            self.update()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        rect = self.rect()
+        p.fillRect(rect, self._BACKGROUND)
+        fill = rect.adjusted(1, 1, -1, -1)
+        fill.setWidth(int(fill.width() * self._value / 100))
+        p.fillRect(fill, self._band_color)
+        p.setPen(self._BORDER)
+        p.drawRect(rect.adjusted(0, 0, -1, -1))
+        p.setPen(self._TEXT)
+        p.drawText(rect, Qt.AlignCenter, f"{self._value}%")
 
 
 class VehicleHUD(QFrame):
@@ -20,16 +117,20 @@ class VehicleHUD(QFrame):
         layout.setContentsMargins(6, 6, 6, 6)
         layout.setSpacing(2)
 
+        # Last applied text per label, to skip redundant updates
+        self._last_text = {}
+        self._last_value = {}  # Quantized numeric value behind each param label
+
         # Vehicle name/icon
         self.name_label = QLabel("✈ BIRD")
         self.name_label.setFont(QFont("Consolas", 10, QFont.Bold))
-        self.name_label.setStyleSheet("color: #4ade80;")
+        self.name_label.setProperty("severity", "ok")
         layout.addWidget(self.name_label)
 
         # Separator
         sep = QFrame()
+        sep.setObjectName("hud_separator")
         sep.setFrameShape(QFrame.HLine)
-        sep.setStyleSheet("background-color: #3a3a5a;")
         sep.setFixedHeight(1)
         layout.addWidget(sep)
 
@@ -45,22 +146,26 @@ class VehicleHUD(QFrame):
             ("BATT", "--%"),
         ]
 
-        for name, default in param_list:
-            row = QHBoxLayout()
-            row.setSpacing(4)
+        # Rows are styled by role in DARK_STYLE (QLabel[role="hud_key"/"hud_val"])
+        form = QFormLayout()
+        form.setSpacing(2)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
 
+        for name, default in param_list:
             label = QLabel(name)
-            label.setStyleSheet("color: #808080; font-size: 9px;")
-            label.setFixedWidth(35)
-            row.addWidget(label)
+            label.setProperty("role", "hud_key")
 
             value = QLabel(default)
-            value.setStyleSheet("color: #e0e0e0; font-size: 10px;")
+            value.setObjectName(f"hud_{name.lower()}_val")
+            value.setProperty("role", "hud_val")
+            value.setProperty("severity", "normal")
             value.setAlignment(Qt.AlignRight)
-            row.addWidget(value)
 
+            form.addRow(label, value)
             self.params[name] = value
-            layout.addLayout(row)
+
+        layout.addLayout(form)
 
         layout.addStretch()
 
@@ -68,63 +173,56 @@ class VehicleHUD(QFrame):
                        speed: float, heading: float, gps_sats: int,
                        battery: int, connected: bool, chick_state: str = None):
         """Update HUD with vehicle data."""
-        self.name_label.setText(f"{icon} {name}")
+        self._set_if_changed(self.name_label, "NAME", f"{icon} {name}",
+                             "ok" if connected else "crit")
 
         if connected:
-            self.name_label.setStyleSheet("color: #4ade80;")
-            self.params["MODE"].setText(mode)
-            self.params["MODE"].setStyleSheet(self._mode_color(mode))
+            self._set_if_changed(self.params["MODE"], "MODE", mode, _mode_severity(mode))
 
             # Chick state display
             if chick_state:
-                state_display = {
-                    "attached": "ATTACHED",
-                    "launching": "LAUNCHING",
-                    "launched": "LAUNCHED",
-                    "recovered": "RECOVERED"
-                }
-                state_colors = {
-                    "attached": "color: #facc15;",   # Yellow
-                    "launching": "color: #f97316;",  # Orange
-                    "launched": "color: #4ade80;",   # Green
-                    "recovered": "color: #60a5fa;"   # Blue
-                }
-                self.params["STATE"].setText(state_display.get(chick_state, chick_state.upper()))
-                self.params["STATE"].setStyleSheet(state_colors.get(chick_state, "color: #e0e0e0;"))
+                text, severity = _CHICK_STATE_STYLE.get(
+                    chick_state, (chick_state.upper(), "normal"))
+                self._set_if_changed(self.params["STATE"], "STATE", text, severity)
             else:
-                self.params["STATE"].setText("N/A")
-                self.params["STATE"].setStyleSheet("color: #606080;")
-
-            self.params["ALT"].setText(f"{alt:.0f} m")
-            self.params["SPD"].setText(f"{speed:.1f} m/s")
-            self.params["HDG"].setText(f"{heading:.0f}°")
-            self.params["GPS"].setText(f"{gps_sats} sats")
-            self.params["GPS"].setStyleSheet(
-                "color: #4ade80;" if gps_sats >= 6 else "color: #facc15;"
-            )
-            self.params["BATT"].setText(f"{battery:.2f}%")
-            self.params["BATT"].setStyleSheet(self._batt_color(battery))
+                self._set_if_changed(self.params["STATE"], "STATE", "N/A", "na")
+
+            # Quantize to display precision first; only format on change
+            alt_q = round(alt)
+            if self._value_changed("ALT", alt_q):
+                self._set_if_changed(self.params["ALT"], "ALT", f"{alt_q} m", "normal")
+            spd_q = round(speed * 10)
+            if self._value_changed("SPD", spd_q):
+                self._set_if_changed(self.params["SPD"], "SPD", f"{spd_q / 10:.1f} m/s", "normal")
+            hdg_q = round(heading)
+            if self._value_changed("HDG", hdg_q):
+                self._set_if_changed(self.params["HDG"], "HDG", f"{hdg_q}°", "normal")
+            if self._value_changed("GPS", gps_sats):
+                self._set_if_changed(self.params["GPS"], "GPS", f"{gps_sats} sats",
+                                     "ok" if gps_sats >= 6 else "warn")
+            batt_q = round(battery * 100)
+            if self._value_changed("BATT", batt_q):
+                self._set_if_changed(self.params["BATT"], "BATT", f"{batt_q / 100:.2f}%",
+                                     _batt_severity(battery))
         else:
-            self.name_label.setStyleSheet("color: #f87171;")
+            self._last_value.clear()
             for key in self.params:
-                self.params[key].setText("---")
-                self.params[key].setStyleSheet("color: #808080;")
-
-    def _mode_color(self, mode: str) -> str:
-        if mode in ("RTL", "LAND"):
-            return "color: #facc15;"
-        elif mode in ("AUTO", "GUIDED"):
-            return "color: #4ade80;"
-        else:
-            return "color: #60a5fa;"
+                self._set_if_changed(self.params[key], key, "---", "off")
 
-    def _batt_color(self, pct: int) -> str:
-        if pct > 50:
-            return "color: #4ade80;"
-        elif pct > 20:
-            return "color: #facc15;"
-        else:
-            return "color: #f87171;"
+    def _value_changed(self, key: str, value) -> bool:
+        """Record a quantized value; True if it differs from the last one."""
+        if self._last_value.get(key) == value:
+            return False
+        self._last_value[key] = value
+        return True
+
+    def _set_if_changed(self, label: QLabel, key: str, text: str, severity: str = None):
+        """Apply text/severity only when they differ from the last applied values."""
+        if self._last_text.get(key) != text:
+            label.setText(text)
+            self._last_text[key] = text
+        if severity is not None:
+            set_style_property(label, "severity", severity)
 
 
 class VehicleCard(QFrame):
@@ -137,6 +235,9 @@ class VehicleCard(QFrame):
         self.vehicle_id = vehicle_id
         self.name = name
         self._selected = False
+        self._last_text = {}  # Last applied text per label
+        self._last_alt = None  # Last displayed altitude (rounded metres)
+        self.setObjectName("vehicle_card")
         self._setup_ui()
         self.update_selection(False)
 
@@ -159,23 +260,19 @@ class VehicleCard(QFrame):
         # Mode
         self.mode_label = QLabel("---")
         self.mode_label.setAlignment(Qt.AlignCenter)
-        self.mode_label.setStyleSheet("color: #60a5fa;")
+        self.mode_label.setProperty("severity", "info")
         self.mode_label.setAttribute(Qt.WA_TransparentForMouseEvents)
         layout.addWidget(self.mode_label)
 
         # Altitude
         self.alt_label = QLabel("-- m")
         self.alt_label.setAlignment(Qt.AlignCenter)
-        self.alt_label.setStyleSheet("color: #a0a0a0;")
+        self.alt_label.setObjectName("vehicle_alt")
         self.alt_label.setAttribute(Qt.WA_TransparentForMouseEvents)
         layout.addWidget(self.alt_label)
 
         # Battery bar
-        self.battery_bar = QProgressBar()
-        self.battery_bar.setRange(0, 100)
-        self.battery_bar.setValue(0)
-        self.battery_bar.setTextVisible(True)
-        self.battery_bar.setFormat("%p%")
+        self.battery_bar = BatteryBar()
         self.battery_bar.setFixedHeight(18)
         self.battery_bar.setAttribute(Qt.WA_TransparentForMouseEvents)
         layout.addWidget(self.battery_bar)
@@ -183,55 +280,46 @@ class VehicleCard(QFrame):
     def update_selection(self, selected: bool):
         """Update selection state."""
         self._selected = selected
-        if selected:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2a3a5a;
-                    border: 2px solid #4a8aba;
-                    border-radius: 6px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2a2a4a;
-                    border: 2px solid #3a3a5a;
-                    border-radius: 6px;
-                }
-            """)
+        set_style_property(self, "selected", selected)
 
     def update_state(self, mode: str, alt: float, battery: int, connected: bool,
                      chick_state: str = None):
         """Update displayed state."""
         # Display mode or chick state
-        if chick_state == "attached":
-            self.mode_label.setText("ATTACHED")
-            self.mode_label.setStyleSheet("color: #facc15;")  # Yellow
-        elif chick_state == "launching":
-            self.mode_label.setText("LAUNCHING")
-            self.mode_label.setStyleSheet("color: #f97316;")  # Orange
+        if chick_state in ("attached", "launching"):
+            self._set_if_changed(self.mode_label, "mode", *_CHICK_STATE_STYLE[chick_state])
+        elif connected:
+            self._set_if_changed(self.mode_label, "mode", mode, _mode_severity(mode))
         else:
-            self.mode_label.setText(mode if connected else "---")
-            # Mode color
-            if not connected:
-                self.mode_label.setStyleSheet("color: #808080;")
-            elif mode in ("RTL", "LAND"):
-                self.mode_label.setStyleSheet("color: #facc15;")
-            elif mode in ("AUTO", "GUIDED"):
-                self.mode_label.setStyleSheet("color: #4ade80;")
-            else:
-                self.mode_label.setStyleSheet("color: #60a5fa;")
+            self._set_if_changed(self.mode_label, "mode", "---", "off")
 
-        self.alt_label.setText(f"{alt:.0f}m" if connected else "-- m")
-        self.battery_bar.setValue(int(battery) if connected else 0)
+        if connected:
+            alt_q = round(alt)
+            if alt_q != self._last_alt:
+                self._last_alt = alt_q
+                self._set_if_changed(self.alt_label, "alt", f"{alt_q}m")
+        else:
+            self._last_alt = None
+            self._set_if_changed(self.alt_label, "alt", "-- m")
+        value = int(battery) if connected else 0
+        self.battery_bar.setValue(value)
 
-        # Battery color
+        # Battery color band
         if battery > 50:
-            self.battery_bar.setStyleSheet("QProgressBar::chunk { background-color: #4ade80; }")
+            band = "good"
         elif battery > 20:
-            self.battery_bar.setStyleSheet("QProgressBar::chunk { background-color: #facc15; }")
+            band = "warn"
         else:
-            self.battery_bar.setStyleSheet("QProgressBar::chunk { background-color: #f87171; }")
+            band = "crit"
+        self.battery_bar.setBand(band)
+
+    def _set_if_changed(self, label: QLabel, key: str, text: str, severity: str = None):
+        """Apply text/severity only when they differ from the last applied values."""
+        if self._last_text.get(key) != text:
+            label.setText(text)
+            self._last_text[key] = text
+        if severity is not None:
+            set_style_property(label, "severity", severity)
 
     def mousePressEvent(self, event):
         """Handle click."""
@@ -250,6 +338,16 @@ class VehiclePanel(QFrame):
         self._cards: dict[str, VehicleCard] = {}
         self._selected_id = None
         self._vehicle_data = {}  # Store full vehicle data for HUD
+        self._last_hud_sig = None  # Displayed-value signature of last HUD update
+
+        # Telemetry arrives per MAVLink message; coalesce card/HUD redraws
+        # to at most one per UI frame (last write wins per vehicle).
+        self._pending: dict[str, dict] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -283,14 +381,9 @@ class VehiclePanel(QFrame):
         cards_layout.setSpacing(8)
 
         # Create cards from config
-        from ..config import get_all_vehicles
-        vehicles = get_all_vehicles()
-
-        for vid, info in vehicles.items():
-            name = info.get("name", vid)
-            icon = info.get("icon", "?")
+        for vid, name, icon in _get_vehicle_entries():
             card = VehicleCard(vid, name)
-            card.clicked.connect(self._on_card_clicked)
+            card.clicked.connect(self._on_card_clicked, Qt.DirectConnection)
             self._cards[vid] = card
             self._vehicle_data[vid] = {"name": name, "icon": icon}
             cards_layout.addWidget(card)
@@ -321,7 +414,8 @@ class VehiclePanel(QFrame):
         self._selected_id = vehicle_id
         self._cards[vehicle_id].update_selection(True)
 
-        # Update HUD
+        # Update HUD (force a repaint for the newly selected vehicle)
+        self._last_hud_sig = None
         self._update_hud(vehicle_id)
 
         if emit_signal:
@@ -330,9 +424,17 @@ class VehiclePanel(QFrame):
     def update_vehicle(self, vehicle_id: str, mode: str, alt: float, battery: int,
                        connected: bool, speed: float = 0, heading: float = 0,
                        gps_sats: int = 0, chick_state: str = None):
-        """Update a vehicle's displayed state."""
+        """Queue a vehicle's displayed state; applied on the next flush."""
         if vehicle_id in self._cards:
-            self._cards[vehicle_id].update_state(mode, alt, battery, connected, chick_state)
+            self._pending[vehicle_id] = {
+                "mode": mode,
+                "alt": alt,
+                "battery": battery,
+                "connected": connected,
+                "chick_state": chick_state,
+            }
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
 
         # Store data for HUD
         if vehicle_id in self._vehicle_data:
@@ -347,13 +449,34 @@ class VehiclePanel(QFrame):
                 "chick_state": chick_state,
             })
 
-        # Update HUD if this is the selected vehicle
-        if vehicle_id == self._selected_id:
-            self._update_hud(vehicle_id)
+    def _flush_pending(self):
+        """Apply the latest queued state for each updated vehicle.
+
+        Only labels whose text changed call update(); Qt merges those into
+        one paint per event-loop pass, so no repaint suspension is needed.
+        """
+        try:
+            for vehicle_id, payload in self._pending.items():
+                self._cards[vehicle_id].update_state(**payload)
+
+            # Update HUD if the selected vehicle changed
+            if self._selected_id in self._pending:
+                self._update_hud(self._selected_id)
+        finally:
+            self._pending.clear()
 
     def _update_hud(self, vehicle_id: str):
         """Update the HUD with data from specified vehicle."""
         data = self._vehicle_data.get(vehicle_id, {})
+
+        # Skip if nothing the HUD displays has changed
+        sig = (data.get("mode"), round(data.get("alt", 0), 1), round(data.get("speed", 0), 1),
+               round(data.get("heading", 0)), data.get("gps_sats"), data.get("battery"),
+               data.get("connected"), data.get("chick_state"))
+        if sig == self._last_hud_sig:
+            return
+        self._last_hud_sig = sig
+
         self.hud.update_vehicle(
             name=data.get("name", "---"),
             icon=data.get("icon", "?"),
@@ -1,30 +1,74 @@
 # Video Feed Widget for SwarmDrones GCS
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QComboBox, QFrame, QPushButton)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+                              QComboBox, QFrame, QPushButton, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject, QThread, QSize
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QFont
 import time
 
+from ..styles import set_style_property
+
+
+def _fit_frame(frame: QImage, size: QSize) -> QImage:
+    """Scale a frame (nearest-neighbour) to fit size, skipping it if it already fits."""
+    target = frame.size().scaled(size, Qt.KeepAspectRatio)
+    if target != frame.size():
+        frame = frame.scaled(target, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+    return frame
+
+
+class FrameConverter(QObject):
+    """Scales incoming video frames on a worker thread.
+
+    QImage is safe to use off the GUI thread (QPixmap is not), so the
+    worker hands back a display-sized QImage and the GUI thread only does
+    the final, cheap pixmap conversion.
+    """
+
+    frame_ready = pyqtSignal(QImage)
+
+    def convert(self, frame: QImage, target_size: QSize):
+        self.frame_ready.emit(_fit_frame(frame, target_size))
+
 
 class VideoDisplay(QLabel):
     """Video display area with overlay support."""
 
+    # Unscaled placeholder shared by all instances (QPixmap is copy-on-write)
+    _PLACEHOLDER_SRC = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(320, 180)
         self.setAlignment(Qt.AlignCenter)
-        self.setStyleSheet("background-color: #0a0a1a; border: 1px solid #3a3a5a;")
+        self.setObjectName("video_display")
 
         # Overlay info
         self.vehicle_name = "BIRD"
         self.recording = False
         self.timestamp = ""
 
-        # Placeholder
+        # Placeholder: rendered once, rescaled only when the widget size changes
+        self._placeholder_src = self._build_placeholder_pixmap()
+        self._scaled_placeholder_cache = None  # (QSize, QPixmap)
+        self._showing_placeholder = False
+
+        # Coalesce bursts of resize events into a single rescale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._draw_placeholder)
+
         self._draw_placeholder()
 
-    def _draw_placeholder(self):
-        """Draw placeholder when no video."""
+    def _build_placeholder_pixmap(self) -> QPixmap:
+        """Return the unscaled placeholder shown when there is no video."""
+        cls = type(self)
+        if cls._PLACEHOLDER_SRC is None:
+            cls._PLACEHOLDER_SRC = self._render_placeholder()
+        return cls._PLACEHOLDER_SRC
+
+    @staticmethod
+    def _render_placeholder() -> QPixmap:
         pixmap = QPixmap(640, 360)
         pixmap.fill(QColor("#0a0a1a"))
 
@@ -45,21 +89,37 @@ class VideoDisplay(QLabel):
         painter.drawLine(cx, cy-20, cx, cy+20)
 
         painter.end()
-        self.setPixmap(pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        return pixmap
+
+    def _draw_placeholder(self):
+        """Show placeholder when no video."""
+        size = self.size()
+        cache = self._scaled_placeholder_cache
+        if cache is None or cache[0] != size:
+            scaled = self._placeholder_src.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            cache = self._scaled_placeholder_cache = (size, scaled)
+        self.setPixmap(cache[1])
+        self._showing_placeholder = True
 
     def set_frame(self, frame: QImage):
         """Set video frame."""
         if frame:
-            pixmap = QPixmap.fromImage(frame)
-            self.setPixmap(pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            # Scale the QImage before conversion so only display-sized
+            # pixels are converted to a pixmap.
+            self.show_scaled_frame(_fit_frame(frame, self.size()))
         else:
             self._draw_placeholder()
 
+    def show_scaled_frame(self, frame: QImage):
+        """Display a frame that has already been scaled to fit."""
+        self.setPixmap(QPixmap.fromImage(frame))
+        self._showing_placeholder = False
+
     def resizeEvent(self, event):
         """Handle resize."""
         super().resizeEvent(event)
-        if self.pixmap():
-            self._draw_placeholder()
+        if self._showing_placeholder:
+            self._resize_timer.start()
 
 
 class VideoWidget(QFrame):
@@ -67,6 +127,10 @@ class VideoWidget(QFrame):
 
     source_changed = pyqtSignal(str)  # vehicle_id
     fullscreen_toggled = pyqtSignal()
+    convert_requested = pyqtSignal(QImage, QSize)  # frame, target size (to converter thread)
+
+    # Source ids in source_combo order
+    _SOURCE_IDS = ("bird", "chick1", "chick2")
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -74,6 +138,20 @@ class VideoWidget(QFrame):
         self._current_source = "bird"
         self._setup_ui()
 
+        # Frame scaling runs on a worker thread; at most one frame is in
+        # flight and frames arriving while it is busy are dropped.
+        self._frame_in_flight = False
+        self._live = False
+        self._converter_thread = QThread()
+        self._converter = FrameConverter()
+        self._converter.moveToThread(self._converter_thread)
+        self.convert_requested.connect(self._converter.convert)
+        self._converter.frame_ready.connect(self._on_frame_ready)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_converter)
+        self._converter_thread.start()
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -88,7 +166,7 @@ class VideoWidget(QFrame):
 
         self.source_combo = QComboBox()
         self.source_combo.addItems(["Bird", "Chick 1", "Chick 2"])
-        self.source_combo.currentTextChanged.connect(self._on_source_changed)
+        self.source_combo.currentIndexChanged.connect(self._on_source_changed)
         header.addWidget(self.source_combo)
 
         layout.addLayout(header)
@@ -107,19 +185,22 @@ class VideoWidget(QFrame):
         ctrl_layout.addStretch()
 
         self.status_label = QLabel("Waiting for stream...")
-        self.status_label.setStyleSheet("color: #808080;")
+        self.status_label.setProperty("severity", "off")
         ctrl_layout.addWidget(self.status_label)
 
         layout.addLayout(ctrl_layout)
 
-    def _on_source_changed(self, text: str):
+    def _on_source_changed(self, idx: int):
         """Handle source selection change."""
-        source_map = {"Bird": "bird", "Chick 1": "chick1", "Chick 2": "chick2"}
-        source = source_map.get(text, "bird")
+        source = self._SOURCE_IDS[idx] if 0 <= idx < len(self._SOURCE_IDS) else "bird"
         self._current_source = source
         self.source_changed.emit(source)
-        self.display._draw_placeholder()
-        self.status_label.setText(f"Switching to {text}...")
+        self._live = False
+        # Rapid (e.g. keyboard) cycling lands here repeatedly with the
+        # placeholder already up; don't repaint it each time
+        if not self.display._showing_placeholder:
+            self.display._draw_placeholder()
+        self.status_label.setText(f"Switching to {self.source_combo.currentText()}...")
 
     def cycle_source(self):
         """Cycle to next video source."""
@@ -129,12 +210,35 @@ class VideoWidget(QFrame):
 
     def set_frame(self, frame: QImage):
         """Update video frame."""
-        self.display.set_frame(frame)
-        self.status_label.setText("Live")
-        self.status_label.setStyleSheet("color: #4ade80;")
+        if not frame:
+            self._live = False
+            self.display.set_frame(frame)
+        else:
+            self._live = True
+            if not self._frame_in_flight:
+                self._frame_in_flight = True
+                self.convert_requested.emit(frame, self.display.size())
+        self._set_status("Live", "ok")
+
+    def _on_frame_ready(self, frame: QImage):
+        """Show a frame scaled by the converter thread."""
+        self._frame_in_flight = False
+        if self._live:
+            self.display.show_scaled_frame(frame)
+
+    def _stop_converter(self):
+        """Stop the frame converter thread on application exit."""
+        self._converter_thread.quit()
+        self._converter_thread.wait()
 
     def set_disconnected(self):
         """Show disconnected state."""
+        self._live = False
         self.display._draw_placeholder()
-        self.status_label.setText("No signal")
-        self.status_label.setStyleSheet("color: #f87171;")
+        self._set_status("No signal", "crit")
+
+    def _set_status(self, text: str, severity: str):
+        """Update the stream status label, skipping unchanged text."""
+        if self.status_label.text() != text:
+            self.status_label.setText(text)
+        set_style_property(self.status_label, "severity", severity)
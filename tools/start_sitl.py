@@ -14,8 +14,10 @@ Usage:
   python tools/start_sitl.py
 """
 
+import functools
 import os
 import sys
+import socket
 import subprocess
 import time
 from pathlib import Path
@@ -28,14 +30,18 @@ SITL_LOCATIONS = [
     Path(os.environ.get('LOCALAPPDATA', '')) / 'Mission Planner' / 'sitl',
 ]
 
-SITL_DIR = None
-for loc in SITL_LOCATIONS:
-    if (loc / 'ArduPlane.exe').exists():
-        SITL_DIR = loc
-        break
 
-if SITL_DIR is None:
-    SITL_DIR = SITL_LOCATIONS[0]  # Default for error message
+@functools.lru_cache(maxsize=1)
+def _find_sitl_dir():
+    for loc in SITL_LOCATIONS:
+        if (loc / 'ArduPlane.exe').exists():
+            return loc
+    return SITL_LOCATIONS[0]  # Default for error message
+
+
+def get_sitl_dir():
+    """SITL binary directory, located on first use rather than at import."""
+    return _find_sitl_dir()
 
 # Vehicle configurations - matches gcs/config.py SWARM_CONFIG
 VEHICLES = [
@@ -68,19 +74,18 @@ VEHICLES = [
 
 def check_binaries():
     """Check if SITL binaries are available."""
-    missing = []
-
-    plane_exe = SITL_DIR / 'ArduPlane.exe'
-    copter_exe = SITL_DIR / 'ArduCopter.exe'
-
-    if not plane_exe.exists():
-        missing.append('ArduPlane.exe')
-    if not copter_exe.exists():
-        missing.append('ArduCopter.exe')
+    sitl_dir = get_sitl_dir()
+    try:
+        with os.scandir(sitl_dir) as it:
+            # Windows file names are case-insensitive
+            names = {entry.name.lower() for entry in it}
+    except OSError:
+        names = set()
+    missing = [exe for exe in ('ArduPlane.exe', 'ArduCopter.exe') if exe.lower() not in names]
 
     if missing:
         print("ERROR: Missing SITL binaries!")
-        print(f"  Looking in: {SITL_DIR}")
+        print(f"  Looking in: {sitl_dir}")
         print(f"  Missing: {', '.join(missing)}")
         print()
         print("To download the binaries:")
@@ -91,25 +96,45 @@ def check_binaries():
         print("  5. Run this script again")
         return False
 
-    print(f"Found SITL binaries at: {SITL_DIR}")
+    print(f"Found SITL binaries at: {sitl_dir}")
     return True
 
 
+def wait_for_port(port, timeout=30.0):
+    """Poll until a SITL TCP port accepts connections. Returns True if ready."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if s.connect_ex(('127.0.0.1', port)) == 0:
+                return True
+        finally:
+            s.close()
+        time.sleep(0.2)
+    return False
+
+
+def sitl_port(instance):
+    """Primary (serial0) TCP port SITL listens on for an instance number."""
+    # Base port 5760, each instance adds 10
+    return 5760 + instance * 10
+
+
 def start_sitl(vehicle, speedup=1, wipe=False):
     """Start a single SITL instance."""
+    sitl_dir = get_sitl_dir()
     name = vehicle['name']
-    exe = SITL_DIR / vehicle['exe']
+    exe = sitl_dir / vehicle['exe']
     instance = vehicle['instance']
     model = vehicle['model']
 
     # Calculate ports for this instance
-    # Base port 5760, each instance adds 10
     # Instance 0: 5760 (serial0), 5762 (serial1), 5763 (serial2)
     # Instance 1: 5770, 5772, 5773
     # Instance 2: 5780, 5782, 5783
-    base_port = 5760 + (instance * 10)
+    base_port = sitl_port(instance)
 
-    # Build command - run from SITL_DIR so DLLs are found
+    # Build command - run from the SITL dir so DLLs are found
     # Let SITL use default ports based on instance number:
     #   Instance 0: 5760, 5762, 5763
     #   Instance 1: 5770, 5772, 5773
@@ -123,7 +148,7 @@ def start_sitl(vehicle, speedup=1, wipe=False):
     ]
 
     # Add --defaults if the param file exists (required for copter frame class)
-    params_file = SITL_DIR / 'default_params' / vehicle['params']
+    params_file = sitl_dir / 'default_params' / vehicle['params']
     if params_file.exists():
         cmd.extend(['--defaults', str(params_file)])
     else:
@@ -140,23 +165,13 @@ def start_sitl(vehicle, speedup=1, wipe=False):
     print(f"  Params: {params_file.name if params_file.exists() else 'NONE'}")
     print(f"  Command: {' '.join(str(c) for c in cmd)}")
 
-    # Create a wrapper batch file that keeps window open on error
-    wrapper_bat = SITL_DIR / f'run_{name.lower()}.bat'
-    cmd_str = ' '.join(f'"{c}"' if ' ' in str(c) else str(c) for c in cmd)
-    with open(wrapper_bat, 'w') as f:
-        f.write(f'@echo off\n')
-        f.write(f'title {name} SITL\n')
-        f.write(f'cd /d "{SITL_DIR}"\n')
-        f.write(f'{cmd_str}\n')
-        f.write(f'echo.\n')
-        f.write(f'echo SITL exited with code %ERRORLEVEL%\n')
-        f.write(f'pause\n')
-
-    # Start the wrapper batch file in new window
+    # Start in a new console; cmd /k keeps the window open after SITL exits
+    # so startup errors stay visible (no wrapper batch file needed)
+    cmd_str = subprocess.list2cmdline([str(c) for c in cmd])
     try:
         subprocess.Popen(
-            ['cmd', '/c', str(wrapper_bat)],
-            cwd=str(SITL_DIR),
+            f'cmd /k "title {name} SITL && {cmd_str}"',
+            cwd=str(sitl_dir),
             creationflags=subprocess.CREATE_NEW_CONSOLE,
         )
         return True
@@ -195,15 +210,24 @@ def main():
     elif args.vehicles == 'copters':
         vehicles_to_start = [v for v in VEHICLES if 'Copter' in v['exe']]
 
-    started = 0
-    for i, vehicle in enumerate(vehicles_to_start):
+    # Launch all instances at once so they boot concurrently
+    launched = []
+    for vehicle in vehicles_to_start:
         if start_sitl(vehicle, speedup=args.speedup, wipe=args.wipe):
-            started += 1
-            if i < len(vehicles_to_start) - 1:
-                print(f"  Waiting 10 seconds before starting next vehicle...")
-                time.sleep(10)  # Wait longer between starts
+            launched.append(vehicle)
         print()
 
+    # Wait for each instance's primary TCP port to come up
+    started = 0
+    for vehicle in launched:
+        port = sitl_port(vehicle['instance'])
+        if wait_for_port(port):
+            print(f"  {vehicle['name']} ready on TCP {port}")
+            started += 1
+        else:
+            print(f"  WARNING: {vehicle['name']} not listening on TCP {port} after 30s")
+    print()
+
     print("=" * 50)
     print(f" Started {started}/{len(vehicles_to_start)} SITL instances")
     print("=" * 50)
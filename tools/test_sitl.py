@@ -10,8 +10,14 @@ Key changes from previous version:
 - More robust arm/takeoff sequence
 """
 
-import time
+import logging
+import logging.handlers
+import multiprocessing
+import select
+import socket
 import sys
+import time
+from collections import deque
 
 try:
     from pymavlink import mavutil
@@ -19,115 +25,253 @@ except ImportError:
     print("ERROR: pymavlink not installed. Run: pip install pymavlink")
     sys.exit(1)
 
+# MAVLink constants used on every command/heartbeat
+_MAV = mavutil.mavlink
+_ARM_CMD = _MAV.MAV_CMD_COMPONENT_ARM_DISARM
+_TAKEOFF = _MAV.MAV_CMD_NAV_TAKEOFF
+_ARMED_FLAG = _MAV.MAV_MODE_FLAG_SAFETY_ARMED
+_STREAM_ALL = _MAV.MAV_DATA_STREAM_ALL
+
+# Display names for GPS fix, command result and vehicle type enums.
+# Fix and result values are dense from 0, so they index a tuple directly.
+_GPS_FIX_NAMES = ("No GPS", "No Fix", "2D", "3D", "DGPS", "RTK Float", "RTK Fixed")
+_ACK_RESULT_NAMES = ("ACCEPTED", "TEMPORARILY_REJECTED", "DENIED", "UNSUPPORTED", "FAILED")
+_MAV_TYPE_NAMES = {1: "PLANE", 2: "QUADCOPTER", 3: "COAX", 4: "HELICOPTER", 13: "HEXACOPTER", 14: "OCTOCOPTER"}
+_COPTER_TYPES = frozenset((2, 3, 4, 13, 14))
+
+# GLOBAL_POSITION_INT unit scales (degE7, mm, cm/s)
+_INV_1E7 = 1e-7
+_INV_1000 = 0.001
+_INV_100 = 0.01
+
+# Vehicles are tested in worker processes: they only enqueue log records and
+# a single listener thread in the parent writes them to stdout
+_logger = logging.getLogger("test_sitl")
+_logger.setLevel(logging.INFO)
+_logger.propagate = False
+
+log = _logger.info
+
+
+def _init_logging(log_queue):
+    """Send this process's log records to the shared log_queue."""
+    _logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+
+
+# (name, text) -> monotonic time it was last printed
+_last_status = {}
+_STATUS_REPEAT_S = 1.0
+
+
+def log_status(name, text):
+    """Log a STATUSTEXT, dropping repeats of the same text within _STATUS_REPEAT_S."""
+    key = (name, text)
+    now = time.monotonic()
+    if now - _last_status.get(key, float('-inf')) > _STATUS_REPEAT_S:
+        _last_status[key] = now
+        log(f"[{name}] STATUS: {text}")
+
 
 def request_data_streams(conn):
     """Request telemetry data streams from the vehicle."""
+    ts, tc = conn.target_system, conn.target_component
     # Request all data streams at 4Hz
     conn.mav.request_data_stream_send(
-        conn.target_system,
-        conn.target_component,
-        mavutil.mavlink.MAV_DATA_STREAM_ALL,
+        ts,
+        tc,
+        _STREAM_ALL,
         4,  # 4 Hz
         1   # Start sending
     )
 
 
+_RECV_CHUNK = 65536
+
+# conn -> messages parsed but not yet consumed (a waiter may stop mid-burst)
+_backlog = {}
+
+
+def drain(conn):
+    """Yield every message that can be parsed without blocking.
+
+    Reads the socket in large chunks and parses each burst with one
+    parse_buffer() call rather than recv_msg()'s frame-sized reads.
+    Raises ConnectionError once the peer has closed the link.
+    """
+    backlog = _backlog.setdefault(conn, deque())
+    sock = conn.port
+    while True:
+        while backlog:
+            yield backlog.popleft()
+        try:
+            data = sock.recv(_RECV_CHUNK)
+        except (BlockingIOError, InterruptedError):
+            return
+        if not data:
+            # The socket stays readable at EOF, so callers would spin in select()
+            raise ConnectionError("connection closed by SITL")
+        msgs = conn.mav.parse_buffer(data) or ()
+        for msg in msgs:
+            # Keep pymavlink's state (conn.messages, target ids) current
+            conn.post_message(msg)
+        backlog.extend(msgs)
+
+
+def wait_readable(conn, timeout):
+    """Sleep in select() until the socket has data or timeout elapses."""
+    if timeout > 0:
+        select.select([conn.port.fileno()], [], [], timeout)
+
+
+def wait_msg(conn, types, timeout):
+    """Wait for the next message whose type is in types, or None on timeout.
+
+    Sleeps in select() on the socket instead of pymavlink's 50ms poll loop.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        # Parse whatever is already buffered before sleeping on the socket
+        for msg in drain(conn):
+            if msg.get_type() in types:
+                return msg
+
+        now = time.monotonic()
+        if now >= deadline:
+            return None
+        wait_readable(conn, deadline - now)
+
+
+def wait_ack(conn, command, timeout):
+    """Wait for the COMMAND_ACK of command, skipping ACKs for other commands."""
+    deadline = time.monotonic() + timeout
+    while (now := time.monotonic()) < deadline:
+        ack = wait_msg(conn, ('COMMAND_ACK',), deadline - now)
+        if ack is not None and ack.command == command:
+            return ack
+    return None
+
+
 def wait_for_gps(conn, name, timeout=60):
     """Wait for GPS 3D fix."""
-    print(f"[{name}] Waiting for GPS 3D fix...")
-    start = time.time()
-
-    while time.time() - start < timeout:
-        msg = conn.recv_match(type='GPS_RAW_INT', blocking=True, timeout=1)
+    log(f"[{name}] Waiting for GPS 3D fix...")
+    deadline = time.monotonic() + timeout
+    last = {}
+
+    while (now := time.monotonic()) < deadline:
+        for msg in drain(conn):
+            mtype = msg.get_type()
+            last[mtype] = msg
+            # Report any pre-arm failure messages
+            if mtype == 'STATUSTEXT':
+                log_status(name, msg.text)
+
+        # Only the newest fix from this wake matters
+        msg = last.pop('GPS_RAW_INT', None)
         if msg:
-            fix_types = {0: "No GPS", 1: "No Fix", 2: "2D", 3: "3D", 4: "DGPS", 5: "RTK Float", 6: "RTK Fixed"}
-            fix_name = fix_types.get(msg.fix_type, f"Fix_{msg.fix_type}")
+            fix_type = msg.fix_type
+            fix_name = _GPS_FIX_NAMES[fix_type] if fix_type < len(_GPS_FIX_NAMES) else f"Fix_{fix_type}"
             sats = msg.satellites_visible
 
-            if msg.fix_type >= 3:
-                print(f"[{name}] GPS: {fix_name}, {sats} sats - READY")
+            if fix_type >= 3:
+                log(f"[{name}] GPS: {fix_name}, {sats} sats - READY")
                 return True
             else:
-                print(f"[{name}] GPS: {fix_name}, {sats} sats - waiting...")
+                log(f"[{name}] GPS: {fix_name}, {sats} sats - waiting...")
 
-        # Check for any pre-arm failure messages
-        status = conn.recv_match(type='STATUSTEXT', blocking=False)
-        if status:
-            print(f"[{name}] STATUS: {status.text}")
+        wait_readable(conn, deadline - now)
 
-    print(f"[{name}] GPS timeout!")
+    log(f"[{name}] GPS timeout!")
     return False
 
 
 def wait_for_ekf(conn, name, timeout=30):
     """Wait for EKF to be ready (healthy)."""
-    print(f"[{name}] Waiting for EKF...")
-    start = time.time()
-
-    while time.time() - start < timeout:
-        msg = conn.recv_match(type='EKF_STATUS_REPORT', blocking=True, timeout=1)
+    log(f"[{name}] Waiting for EKF...")
+    deadline = time.monotonic() + timeout
+    last = {}
+
+    while (now := time.monotonic()) < deadline:
+        for msg in drain(conn):
+            mtype = msg.get_type()
+            last[mtype] = msg
+            # Check for status messages
+            if mtype == 'STATUSTEXT':
+                log_status(name, msg.text)
+
+        msg = last.pop('EKF_STATUS_REPORT', None)
         if msg:
             # Check EKF flags - we want attitude and velocity estimates
             flags = msg.flags
             # EKF_ATTITUDE = 1, EKF_VELOCITY_HORIZ = 2, EKF_VELOCITY_VERT = 4, EKF_POS_HORIZ_REL = 8
             if flags & 0x0F == 0x0F:  # All basic flags set
-                print(f"[{name}] EKF ready (flags=0x{flags:02X})")
+                log(f"[{name}] EKF ready (flags=0x{flags:02X})")
                 return True
 
-        # Check for status messages
-        status = conn.recv_match(type='STATUSTEXT', blocking=False)
-        if status:
-            print(f"[{name}] STATUS: {status.text}")
+        wait_readable(conn, deadline - now)
 
-    print(f"[{name}] EKF timeout (may still work)")
+    log(f"[{name}] EKF timeout (may still work)")
     return True  # Continue anyway, some SITLs don't report EKF
 
 
+def drain_status(conn, name):
+    """Log any STATUSTEXT already received, without waiting for more."""
+    messages = [msg.text for msg in drain(conn) if msg.get_type() == 'STATUSTEXT']
+    for text in messages:
+        log_status(name, text)
+    return messages
+
+
 def get_prearm_status(conn, name, duration=3):
     """Collect any pre-arm status messages."""
-    print(f"[{name}] Checking pre-arm status...")
-    start = time.time()
+    log(f"[{name}] Checking pre-arm status...")
+    deadline = time.monotonic() + duration
     messages = []
 
-    while time.time() - start < duration:
-        msg = conn.recv_match(type='STATUSTEXT', blocking=True, timeout=0.5)
-        if msg:
-            text = msg.text if hasattr(msg, 'text') else str(msg)
-            messages.append(text)
-            print(f"[{name}] STATUS: {text}")
-
-    return messages
+    # One pass over the stream: drain everything on each wake until the deadline
+    while True:
+        messages.extend(drain_status(conn, name))
+        now = time.monotonic()
+        if now >= deadline:
+            return messages
+        wait_readable(conn, deadline - now)
 
 
 def set_mode_and_wait(conn, name, mode_name, mode_id, timeout=5):
     """Set mode and wait for confirmation."""
-    print(f"[{name}] Setting mode to {mode_name} ({mode_id})...")
+    log(f"[{name}] Setting mode to {mode_name} ({mode_id})...")
 
     # Determine if plane or copter based on last heartbeat
     conn.set_mode(mode_id)
 
-    # Wait for mode change confirmation
-    start = time.time()
-    while time.time() - start < timeout:
-        msg = conn.recv_match(type='HEARTBEAT', blocking=True, timeout=1)
-        if msg:
-            if msg.custom_mode == mode_id:
-                print(f"[{name}] Mode changed to {mode_name}")
-                return True
+    # Wait for mode change confirmation; pymavlink keeps the newest
+    # heartbeat in conn.messages, so drain and check that once per wake
+    deadline = time.monotonic() + timeout
+    while (now := time.monotonic()) < deadline:
+        for msg in drain(conn):
+            if msg.get_type() == 'STATUSTEXT':
+                log_status(name, msg.text)
+
+        heartbeat = conn.messages.get('HEARTBEAT')
+        if heartbeat is not None and heartbeat.custom_mode == mode_id:
+            log(f"[{name}] Mode changed to {mode_name}")
+            return True
 
-    print(f"[{name}] Mode change timeout")
+        wait_readable(conn, deadline - now)
+
+    log(f"[{name}] Mode change timeout")
     return False
 
 
 def arm_and_wait(conn, name, force=True, timeout=10):
     """Arm the vehicle and wait for confirmation."""
-    print(f"[{name}] Arming{'(force)' if force else ''}...")
+    log(f"[{name}] Arming{'(force)' if force else ''}...")
 
     # Send arm command
+    ts, tc = conn.target_system, conn.target_component
     conn.mav.command_long_send(
-        conn.target_system,
-        conn.target_component,
-        mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM,
+        ts,
+        tc,
+        _ARM_CMD,
         0,  # confirmation
         1,  # arm
         21196 if force else 0,  # force arm magic number
@@ -135,11 +279,10 @@ def arm_and_wait(conn, name, force=True, timeout=10):
     )
 
     # Wait for ACK
-    ack = conn.recv_match(type='COMMAND_ACK', blocking=True, timeout=5)
+    ack = wait_ack(conn, _ARM_CMD, 5)
     if ack:
-        result_names = {0: "ACCEPTED", 1: "TEMPORARILY_REJECTED", 2: "DENIED", 3: "UNSUPPORTED", 4: "FAILED"}
-        result = result_names.get(ack.result, f"RESULT_{ack.result}")
-        print(f"[{name}] ARM ACK: {result}")
+        result = _ACK_RESULT_NAMES[ack.result] if ack.result < len(_ACK_RESULT_NAMES) else f"RESULT_{ack.result}"
+        log(f"[{name}] ARM ACK: {result}")
 
         if ack.result != 0:
             # Collect status messages to see why
@@ -147,35 +290,40 @@ def arm_and_wait(conn, name, force=True, timeout=10):
             return False
 
     # Wait for armed state in heartbeat
-    start = time.time()
-    while time.time() - start < timeout:
-        msg = conn.recv_match(type='HEARTBEAT', blocking=True, timeout=1)
+    deadline = time.monotonic() + timeout
+    last = {}
+    while (now := time.monotonic()) < deadline:
+        for msg in drain(conn):
+            mtype = msg.get_type()
+            last[mtype] = msg
+            # Check status messages for any pre-arm failures
+            if mtype == 'STATUSTEXT':
+                log_status(name, msg.text)
+
+        msg = last.pop('HEARTBEAT', None)
         if msg:
-            armed = (msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED) != 0
+            armed = (msg.base_mode & _ARMED_FLAG) != 0
             if armed:
-                print(f"[{name}] ARMED!")
+                log(f"[{name}] ARMED!")
                 return True
             else:
-                print(f"[{name}] Waiting for armed state...")
+                log(f"[{name}] Waiting for armed state...")
 
-        # Check status messages for any pre-arm failures
-        status = conn.recv_match(type='STATUSTEXT', blocking=False)
-        if status:
-            text = status.text if hasattr(status, 'text') else str(status)
-            print(f"[{name}] STATUS: {text}")
+        wait_readable(conn, deadline - now)
 
-    print(f"[{name}] Arm timeout - vehicle did not arm")
+    log(f"[{name}] Arm timeout - vehicle did not arm")
     return False
 
 
 def takeoff(conn, name, altitude=30, timeout=5):
     """Send takeoff command."""
-    print(f"[{name}] Takeoff to {altitude}m...")
+    log(f"[{name}] Takeoff to {altitude}m...")
 
+    ts, tc = conn.target_system, conn.target_component
     conn.mav.command_long_send(
-        conn.target_system,
-        conn.target_component,
-        mavutil.mavlink.MAV_CMD_NAV_TAKEOFF,
+        ts,
+        tc,
+        _TAKEOFF,
         0,  # confirmation
         0,  # pitch
         0, 0, 0,  # empty
@@ -183,92 +331,115 @@ def takeoff(conn, name, altitude=30, timeout=5):
         altitude
     )
 
-    ack = conn.recv_match(type='COMMAND_ACK', blocking=True, timeout=timeout)
+    ack = wait_ack(conn, _TAKEOFF, timeout)
     if ack:
-        result_names = {0: "ACCEPTED", 1: "TEMPORARILY_REJECTED", 2: "DENIED", 3: "UNSUPPORTED", 4: "FAILED"}
-        result = result_names.get(ack.result, f"RESULT_{ack.result}")
-        print(f"[{name}] TAKEOFF ACK: {result}")
+        result = _ACK_RESULT_NAMES[ack.result] if ack.result < len(_ACK_RESULT_NAMES) else f"RESULT_{ack.result}"
+        log(f"[{name}] TAKEOFF ACK: {result}")
         return ack.result == 0
 
-    print(f"[{name}] Takeoff no ACK")
+    log(f"[{name}] Takeoff no ACK")
     return False
 
 
 def monitor_flight(conn, name, duration=15):
     """Monitor vehicle during flight."""
-    print(f"\n[{name}] Monitoring flight for {duration}s...")
-    start = time.time()
-    last_pos_time = 0
-
-    while time.time() - start < duration:
-        # Check for position updates
-        msg = conn.recv_match(type='GLOBAL_POSITION_INT', blocking=True, timeout=0.5)
-        if msg:
-            lat = msg.lat / 1e7
-            lon = msg.lon / 1e7
-            alt = msg.relative_alt / 1000.0
-            vz = msg.vz / 100.0  # cm/s to m/s (positive = down)
-
-            if time.time() - last_pos_time > 1:  # Print every second
-                print(f"[{name}] Alt={alt:.1f}m, Vz={-vz:.1f}m/s (lat={lat:.6f}, lon={lon:.6f})")
-                last_pos_time = time.time()
-
-        # Check for status messages
-        status = conn.recv_match(type='STATUSTEXT', blocking=False)
-        if status:
-            text = status.text if hasattr(status, 'text') else str(status)
-            print(f"[{name}] STATUS: {text}")
+    log(f"\n[{name}] Monitoring flight for {duration}s...")
+    deadline = time.monotonic() + duration
+    last_pos_time = float('-inf')
+    last = {}
+
+    while (now := time.monotonic()) < deadline:
+        for msg in drain(conn):
+            mtype = msg.get_type()
+            last[mtype] = msg
+            # Check for status messages
+            if mtype == 'STATUSTEXT':
+                log_status(name, msg.text)
+
+        # Print the newest position every second
+        msg = last.pop('GLOBAL_POSITION_INT', None)
+        if msg and now - last_pos_time > 1:
+            lat = msg.lat * _INV_1E7
+            lon = msg.lon * _INV_1E7
+            alt = msg.relative_alt * _INV_1000
+            vz = msg.vz * _INV_100  # cm/s to m/s (positive = down)
+            log(f"[{name}] Alt={alt:.1f}m, Vz={-vz:.1f}m/s (lat={lat:.6f}, lon={lon:.6f})")
+            last_pos_time = now
+
+        wait_readable(conn, deadline - now)
+
+
+_SOCK_BUF_BYTES = 1 << 20  # 1 MB, room for several SITLs streaming at once
+
+
+def tune_socket(conn, name):
+    """Enlarge the kernel buffers on TCP links.
+
+    pymavlink's mavtcp already sets TCP_NODELAY and non-blocking mode.
+    """
+    sock = getattr(conn, 'port', None)
+    if not isinstance(sock, socket.socket) or sock.type != socket.SOCK_STREAM:
+        return  # Not a TCP connection
+
+    for opt, label in ((socket.SO_RCVBUF, "SO_RCVBUF"), (socket.SO_SNDBUF, "SO_SNDBUF")):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, opt, _SOCK_BUF_BYTES)
+            actual = sock.getsockopt(socket.SOL_SOCKET, opt)
+        except OSError as e:
+            log(f"[{name}] WARNING: could not set {label}: {e}")
+            continue
+        # Linux reports double the requested size; anything lower was capped
+        if actual < _SOCK_BUF_BYTES:
+            log(f"[{name}] WARNING: {label} capped at {actual} bytes "
+                f"(raise net.core.rmem_max/wmem_max)")
 
 
 def test_connection(name, conn_str):
-    """Test connection to a single SITL instance with full initialization."""
-    print(f"\n{'='*60}")
-    print(f" Testing: {name} at {conn_str}")
-    print('='*60)
+    """Open a MAVLink connection to a single SITL instance."""
+    log(f"\n{'='*60}\n Testing: {name} at {conn_str}\n{'='*60}")
 
     try:
-        # Connect
-        print(f"[{name}] Connecting...")
-        conn = mavutil.mavlink_connection(conn_str, source_system=255)
+        log(f"[{name}] Connecting...")
+        # No connect retries: a SITL that isn't listening fails at once
+        conn = mavutil.mavlink_connection(conn_str, source_system=255,
+                                          dialect='ardupilotmega', robust_parsing=True,
+                                          retries=0)
+        tune_socket(conn, name)
+        return conn
+    except Exception as e:
+        log(f"[{name}] ERROR: {e}")
+        return None
 
-        # Wait for heartbeat
-        print(f"[{name}] Waiting for heartbeat...")
-        msg = conn.recv_match(type='HEARTBEAT', blocking=True, timeout=10)
 
-        if not msg:
-            print(f"[{name}] ERROR: No heartbeat received")
-            return None, None
+def wait_for_heartbeat(conn, timeout=10):
+    """Wait for the vehicle's first HEARTBEAT, or None on timeout."""
+    return wait_msg(conn, ('HEARTBEAT',), timeout)
 
-        # Parse heartbeat
-        mav_type = msg.type
-        type_names = {1: "PLANE", 2: "QUADCOPTER", 3: "COAX", 4: "HELICOPTER", 13: "HEXACOPTER", 14: "OCTOCOPTER"}
-        type_name = type_names.get(mav_type, f"TYPE_{mav_type}")
-        is_copter = mav_type in [2, 3, 4, 13, 14]
 
-        armed = (msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED) != 0
+def init_vehicle(name, conn, msg):
+    """Report the vehicle from its first heartbeat and start telemetry. Returns is_copter."""
+    mav_type = msg.type
+    type_name = _MAV_TYPE_NAMES.get(mav_type, f"TYPE_{mav_type}")
+    is_copter = mav_type in _COPTER_TYPES
 
-        print(f"[{name}] Connected! SysID={msg.get_srcSystem()}, Type={type_name}")
-        print(f"[{name}] Armed={armed}, Mode={msg.custom_mode}")
+    armed = (msg.base_mode & _ARMED_FLAG) != 0
 
-        # Request data streams
-        request_data_streams(conn)
+    log(f"[{name}] Connected! SysID={msg.get_srcSystem()}, Type={type_name}")
+    log(f"[{name}] Armed={armed}, Mode={msg.custom_mode}")
 
-        return conn, is_copter
+    # Request data streams
+    request_data_streams(conn)
 
-    except Exception as e:
-        print(f"[{name}] ERROR: {e}")
-        return None, None
+    return is_copter
 
 
 def test_full_flight_sequence(conn, name, is_copter=True):
     """Run full arm/takeoff/monitor sequence."""
-    print(f"\n{'='*60}")
-    print(f" Flight Test: {name}")
-    print('='*60)
+    log(f"\n{'='*60}\n Flight Test: {name}\n{'='*60}")
 
     # 1. Wait for GPS
     if not wait_for_gps(conn, name, timeout=30):
-        print(f"[{name}] Skipping arm - no GPS")
+        log(f"[{name}] Skipping arm - no GPS")
         return False
 
     # 2. Set mode (GUIDED for copter, FBWA for plane)
@@ -279,22 +450,18 @@ def test_full_flight_sequence(conn, name, is_copter=True):
 
     set_mode_and_wait(conn, name, mode_name, mode_id)
 
-    # Small delay to let mode settle
-    time.sleep(1)
-
-    # 3. Check pre-arm status
-    get_prearm_status(conn, name, 2)
+    # 3. Report any pre-arm status already received
+    drain_status(conn, name)
 
     # 4. Arm
     if not arm_and_wait(conn, name, force=True, timeout=10):
-        print(f"[{name}] Failed to arm")
+        log(f"[{name}] Failed to arm")
         return False
 
     # 5. Takeoff (copter only)
     if is_copter:
-        time.sleep(0.5)  # Brief delay after arm
         if not takeoff(conn, name, altitude=30):
-            print(f"[{name}] Takeoff command failed")
+            log(f"[{name}] Takeoff command failed")
             # Continue anyway - monitor what happens
 
     # 6. Monitor flight
@@ -303,12 +470,53 @@ def test_full_flight_sequence(conn, name, is_copter=True):
     return True
 
 
-def main():
-    print("="*60)
-    print("  SITL Diagnostic Tool v2")
-    print("="*60)
-    print("\nMake sure SITL instances are running (tools/start_sitl.py)")
-    print("This will test connectivity, GPS, arming, and flight.\n")
+def test_plane_arm(conn, name):
+    """Set FBWA and arm - planes need a runway/VTOL to actually take off."""
+    log(f"\n[{name}] Plane test - setting FBWA mode and arming")
+    set_mode_and_wait(conn, name, "FBWA", 5)
+    return arm_and_wait(conn, name, force=True)
+
+
+def run_vehicle(name, conn, is_copter):
+    """Run the test flow for one connected vehicle."""
+    if is_copter:
+        return test_full_flight_sequence(conn, name, is_copter=True)
+    return test_plane_arm(conn, name)
+
+
+def run_sitl(name, conn_str):
+    """Connect to one SITL and run its test flow. Runs in its own worker process.
+
+    Returns None if the vehicle never connected, else whether its test passed.
+    """
+    try:
+        conn = test_connection(name, conn_str)
+        if conn is None:
+            return None
+
+        log(f"[{name}] Waiting for heartbeat...")
+        heartbeat = wait_for_heartbeat(conn, timeout=10)
+        if heartbeat is None:
+            log(f"[{name}] ERROR: No heartbeat received")
+            conn.close()
+            return None
+
+        is_copter = init_vehicle(name, conn, heartbeat)
+        try:
+            return bool(run_vehicle(name, conn, is_copter))
+        finally:
+            conn.close()
+    except Exception as e:
+        # Report and fail this vehicle only; the other workers carry on
+        log(f"[{name}] ERROR: {e}")
+        return False
+
+
+def run_diagnostics(log_queue):
+    """Connect to every SITL and run the vehicle tests, one process per SITL."""
+    log(f"{'='*60}\n  SITL Diagnostic Tool v2\n{'='*60}")
+    log("\nMake sure SITL instances are running (tools/start_sitl.py)")
+    log("This will test connectivity, GPS, arming, and flight.\n")
 
     # Test connections
     connections = {
@@ -317,43 +525,40 @@ def main():
         "chick1.2": "tcp:127.0.0.1:5780",
     }
 
-    # First pass: connect to all
-    active_conns = {}
-    for name, conn_str in connections.items():
-        conn, is_copter = test_connection(name, conn_str)
-        if conn:
-            active_conns[name] = (conn, is_copter)
-
-    if not active_conns:
-        print("\nERROR: No SITL instances connected!")
-        print("Run: python tools/start_sitl.py")
-        input("\nPress Enter to exit...")
+    # Each SITL gets its own process (own GIL and pymavlink state), so a
+    # crash or stall in one doesn't affect the others; connects run in parallel
+    with multiprocessing.Pool(len(connections), initializer=_init_logging, initargs=(log_queue,)) as pool:
+        results = dict(zip(connections, pool.starmap(run_sitl, connections.items())))
+        # Let workers exit normally so their queue feeders flush the last
+        # log records; leaving the with block alone would terminate() them
+        pool.close()
+        pool.join()
+
+    if all(ok is None for ok in results.values()):
+        log("\nERROR: No SITL instances connected!")
+        log("Run: python tools/start_sitl.py")
         return
 
-    print(f"\n{'='*60}")
-    print(f"  Connected to {len(active_conns)} SITL instance(s)")
-    print('='*60)
-
-    # Test flight on first copter
-    for name, (conn, is_copter) in active_conns.items():
-        if is_copter:
-            test_full_flight_sequence(conn, name, is_copter=True)
-            break  # Just test one copter for now
-
-    # Also test plane if connected
-    for name, (conn, is_copter) in active_conns.items():
-        if not is_copter:
-            print(f"\n[{name}] Plane test - setting FBWA mode and arming")
-            set_mode_and_wait(conn, name, "FBWA", 5)
-            time.sleep(1)
-            arm_and_wait(conn, name, force=True)
-            # Planes need a runway/VTOL to actually take off
-            # Just verify it arms
-            break
-
-    print("\n" + "="*60)
-    print("  Diagnostic complete!")
-    print("="*60)
+    summary = "\n".join(
+        f"  {name}: {'NO CONNECTION' if ok is None else 'PASS' if ok else 'FAIL'}"
+        for name, ok in results.items()
+    )
+    log(f"\n{'='*60}\n  Diagnostic complete!\n{summary}\n{'='*60}")
+
+
+def main():
+    log_queue = multiprocessing.Queue()
+    _init_logging(log_queue)
+
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+    listener.start()
+    try:
+        run_diagnostics(log_queue)
+    finally:
+        # Flush queued output before prompting
+        listener.stop()
 
     input("\nPress Enter to exit...")
 